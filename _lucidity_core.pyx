@@ -0,0 +1,46 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled kernel for the position-based ROT category formulas
+
+Optional; lucidity_beatmap falls back to Numba or NumPy when this
+extension is not built. Build with: python setup.py build_ext --inplace
+"""
+
+from libc.math cimport fabs, fmod
+
+
+def compute_breakdowns(double[::1] pos, float[:, ::1] out):
+    """
+    Fill columns 1-5 of the breakdown matrix (the five position-based
+    ROT categories) for the given segment positions
+    """
+    cdef Py_ssize_t i, n = pos.shape[0]
+    cdef double p, v
+
+    for i in range(n):
+        p = pos[i]
+
+        # Vagueness often front-loaded
+        if p < 0.5:
+            v = 80 - p * 60
+            out[i, 1] = <float>(v if v > 0 else 0)
+        else:
+            out[i, 1] = 20.0
+
+        # Intent decay back-loaded
+        v = p * 120
+        out[i, 2] = <float>(v if v < 100 else 100)
+
+        # Confidence inflation periodic
+        out[i, 3] = <float>(30 + 20 * fabs(0.5 - fmod(p, 0.25) * 4))
+
+        # Voice degradation late onset
+        if p > 0.7:
+            v = (p - 0.7) * 200
+            out[i, 4] = <float>(v if v > 0 else 0)
+        else:
+            out[i, 4] = 5.0
+
+        # Entropy collapse early
+        v = 60 - p * 50
+        out[i, 5] = <float>(v if v > 0 else 0)
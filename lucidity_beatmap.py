@@ -9,12 +9,125 @@ Powered by ACTS (Automated Convergence Triangulation System)
 Authors: Michael Edwin Robinson (Framework), Terrance Robinson (Execution)
 """
 
+from __future__ import annotations
+
+import re
 import sys
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import List, Dict, Sequence, Tuple, Optional
+from dataclasses import dataclass, field
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_HAVE_NUMBA = False
+_HAVE_CORE = False
+if np is not None:
+    try:
+        from _lucidity_core import compute_breakdowns as _core_compute_breakdowns
+        _HAVE_CORE = True
+    except ImportError:
+        pass
+
+    try:
+        from numba import njit
+        _HAVE_NUMBA = True
+    except ImportError:
+        pass
+
+
+# Color codes for terminal output
+_COLORS = {
+    'reset': '\033[0m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'orange': '\033[38;5;208m',
+    'red': '\033[91m',
+    'bold': '\033[1m',
+    'dim': '\033[2m'
+}
+
+_RESET = _COLORS['reset']
+
+# Shared confidence labels; segments index these so every segment holds
+# the same two string objects rather than its own copies
+_CONFIDENCE = ('High', 'Medium')
+
+# Hex colors per bucket for the HTML renderer
+_COLORS_HEX = ('#00ff00', '#ffff00', '#ff8800', '#ff0000')
+
+# Whole status labels precomputed per color bucket (green/yellow/orange/red)
+_STATUS_PLAIN = ('Good', 'Caution', 'Warning', 'Alert!')
+_STATUS_COLOR = (
+    'Good',
+    f"{_COLORS['yellow']}Caution{_RESET}",
+    f"{_COLORS['orange']}Warning{_RESET}",
+    f"{_COLORS['red']}Alert!{_RESET}"
+)
 
 
-@dataclass
+def _position_breakdown(pos: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fill columns 1-5 of the breakdown matrix (the five position-based
+    ROT categories) for the given segment positions
+
+    NumPy fallback; replaced by the Cython extension or a compiled
+    Numba kernel when either is available
+    """
+    # Vagueness often front-loaded
+    out[:, 1] = np.where(pos < 0.5, np.maximum(0, 80 - pos * 60), 20)
+
+    # Intent decay back-loaded
+    out[:, 2] = np.minimum(100, pos * 120)
+
+    # Confidence inflation periodic
+    out[:, 3] = 30 + 20 * np.abs(0.5 - (pos % 0.25) * 4)
+
+    # Voice degradation late onset
+    out[:, 4] = np.where(pos > 0.7, np.maximum(0, (pos - 0.7) * 200), 5)
+
+    # Entropy collapse early
+    out[:, 5] = np.maximum(0, 60 - pos * 50)
+
+
+if np is None:
+    def _position_breakdown(pos, out):
+        """
+        Pure-Python fallback used when NumPy is unavailable; out is a
+        list of per-segment array('f') rows
+        """
+        for i, p in enumerate(pos):
+            row = out[i]
+            row[1] = max(0.0, 80 - p * 60) if p < 0.5 else 20.0
+            row[2] = min(100.0, p * 120)
+            row[3] = 30 + 20 * abs(0.5 - (p % 0.25) * 4)
+            row[4] = max(0.0, (p - 0.7) * 200) if p > 0.7 else 5.0
+            row[5] = max(0.0, 60 - p * 50)
+
+elif _HAVE_CORE:
+    _position_breakdown = _core_compute_breakdowns
+
+elif _HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _position_breakdown(pos, out):
+        for i in range(pos.shape[0]):
+            p = pos[i]
+            out[i, 1] = max(0.0, 80 - p * 60) if p < 0.5 else 20.0
+            out[i, 2] = min(100.0, p * 120)
+            out[i, 3] = 30 + 20 * abs(0.5 - (p % 0.25) * 4)
+            out[i, 4] = max(0.0, (p - 0.7) * 200) if p > 0.7 else 5.0
+            out[i, 5] = max(0.0, 60 - p * 50)
+
+    # Warm up the JIT at import so compile time doesn't land in the
+    # first analyze_content() call
+    _position_breakdown(np.zeros(1), np.zeros((1, 6), dtype=np.float32))
+
+
+@dataclass(slots=True, frozen=True)
 class BeatMapSegment:
     """Represents one segment in the beat map timeline"""
     start_pos: int
@@ -22,7 +135,9 @@ class BeatMapSegment:
     degradation_score: float
     primary_issue: str
     confidence: str
-    degradation_breakdown: Dict[str, float]
+    # Row of LucidityBeatMap._breakdown_matrix; excluded from __eq__ and
+    # __hash__ since comparing array views element-wise is ambiguous
+    breakdown_row: Sequence[float] = field(compare=False)
 
 
 class LucidityBeatMap:
@@ -31,17 +146,10 @@ class LucidityBeatMap:
     Shows where and how AI output quality degrades across content
     """
     
-    # Color codes for terminal output
-    COLORS = {
-        'reset': '\033[0m',
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'orange': '\033[38;5;208m',
-        'red': '\033[91m',
-        'bold': '\033[1m',
-        'dim': '\033[2m'
-    }
-    
+    # Kept as a class attribute for callers; the module-level _COLORS
+    # aliases avoid the attribute + dict lookups in the hot paths
+    COLORS = _COLORS
+
     # Degradation categories (The ROT - 6 categories)
     CATEGORIES = [
         'Repetition',
@@ -60,7 +168,14 @@ class LucidityBeatMap:
         'Voice Degradation': 'VOI',
         'Entropy Collapse': 'ENT'
     }
-    
+
+    # Column index of each category in the breakdown matrix
+    _cat_index = {name: i for i, name in enumerate(CATEGORIES)}
+
+    # Visualization buckets: green <25, yellow <50, orange <75, red >=75
+    _BUCKET_CHARS = ('░', '▒', '▓', '█')
+    _BUCKET_COLORS = ('green', 'yellow', 'orange', 'red')
+
     def __init__(self, segments: int = 20, use_color: bool = True):
         """
         Initialize Beat Map generator
@@ -72,7 +187,22 @@ class LucidityBeatMap:
         self.segments = segments
         self.use_color = use_color
         self.beat_segments: List[BeatMapSegment] = []
-    
+        self._breakdown_matrix: Optional[Sequence[Sequence[float]]] = None
+        self._overall: Optional[Sequence[float]] = None
+        self._bucket_ids: Optional[Sequence[int]] = None
+        self._category_avgs: Optional[Dict[str, float]] = None
+        self._spikes: Optional[List[Tuple[float, float]]] = None
+        self._findings: Optional[Dict[str, str]] = None
+
+        # Bind the color-dependent helpers once instead of re-checking
+        # use_color inside every render call
+        if use_color:
+            self._generate_degradation_bar = self._generate_degradation_bar_color
+            self._get_status = self._get_status_color
+        else:
+            self._generate_degradation_bar = self._generate_degradation_bar_plain
+            self._get_status = self._get_status_plain
+
     def analyze_content(self, content: str, degradation_data: Dict) -> List[BeatMapSegment]:
         """
         Analyze content and create beat map segments
@@ -84,85 +214,97 @@ class LucidityBeatMap:
         Returns:
             List of BeatMapSegment objects
         """
+        self._breakdown_matrix = None
+        self._overall = None
+        self._bucket_ids = None
+        self._category_avgs = None
+        self._spikes = None
+        self._findings = None
+
         content_length = len(content)
         segment_size = content_length // self.segments
-        
-        segments = []
-        
-        for i in range(self.segments):
-            start = i * segment_size
-            end = start + segment_size if i < self.segments - 1 else content_length
-            
-            # Calculate degradation for this segment
-            segment_text = content[start:end]
-            
-            # Simulate degradation scoring (integrate with ACTS here)
-            seg_score = self._calculate_segment_degradation(
-                segment_text, 
-                degradation_data,
-                position=i/self.segments
+
+        # Segment boundaries (last segment absorbs the remainder)
+        bounds = [
+            (i * segment_size,
+             (i + 1) * segment_size if i < self.segments - 1 else content_length)
+            for i in range(self.segments)
+        ]
+
+        # This is where ACTS integration happens; for demo purposes,
+        # using realistic patterns
+        if np is not None:
+            pos = np.arange(self.segments, dtype=np.float64) / self.segments
+            scores = np.empty((self.segments, 6), dtype=np.float32)
+        else:
+            # array.array keeps the compact 4-byte float layout when
+            # NumPy is not installed
+            pos = [i / self.segments for i in range(self.segments)]
+            scores = [array('f', b'\0' * 24) for _ in range(self.segments)]
+
+        # Repetition tends to cluster; it depends on segment text, not
+        # position. Tokenize the document once and assign words to
+        # segments by character offset rather than copying each
+        # segment's text out of content.
+        words = []
+        word_starts = []
+        for match in re.finditer(r'\S+', content):
+            words.append(match.group())
+            word_starts.append(match.start())
+
+        for i, (start, end) in enumerate(bounds):
+            lo = bisect_left(word_starts, start)
+            hi = bisect_left(word_starts, end)
+            seg_words = words[lo:hi]
+            scores[i][0] = min(100, len(set(seg_words)) / max(1, len(seg_words)) * 100)
+
+        # The five position-based categories fill columns 1-5
+        _position_breakdown(pos, scores)
+
+        if np is not None:
+            overall = scores.mean(axis=1)
+            primary_idx = scores.argmax(axis=1)
+            conf_idx = ((overall >= 30) & (overall <= 70)).astype(np.uint8)
+            # Quantize once to 0-3 color-bucket ids so rendering is a
+            # table lookup
+            bucket_ids = np.clip(overall // 25, 0, 3).astype(np.uint8)
+            category_avgs = dict(zip(self.CATEGORIES, scores.mean(axis=0).tolist()))
+        else:
+            overall = array('f', (sum(row) / 6 for row in scores))
+            primary_idx = array('B', (max(range(6), key=row.__getitem__) for row in scores))
+            conf_idx = array('B', (30 <= o <= 70 for o in overall))
+            bucket_ids = array('B', (min(int(o) // 25, 3) for o in overall))
+            category_avgs = {
+                cat: sum(row[j] for row in scores) / self.segments
+                for j, cat in enumerate(self.CATEGORIES)
+            }
+
+        self._breakdown_matrix = scores
+        self._overall = overall
+        self._bucket_ids = bucket_ids
+
+        segments = [
+            BeatMapSegment(
+                start_pos=bounds[i][0],
+                end_pos=bounds[i][1],
+                degradation_score=float(overall[i]),
+                primary_issue=self.CATEGORIES[primary_idx[i]],
+                confidence=_CONFIDENCE[conf_idx[i]],
+                breakdown_row=scores[i]
             )
-            
-            segments.append(BeatMapSegment(
-                start_pos=start,
-                end_pos=end,
-                degradation_score=seg_score['overall'],
-                primary_issue=seg_score['primary'],
-                confidence=seg_score['confidence'],
-                degradation_breakdown=seg_score['breakdown']
-            ))
-        
+            for i in range(self.segments)
+        ]
+
         self.beat_segments = segments
+        self._category_avgs = category_avgs
+
+        # Inputs are frozen from here on, so spikes and findings can be
+        # computed once and served to every renderer
+        self._spikes = self._find_spikes()
+        self._findings = self._generate_findings()
+
         return segments
     
-    def _calculate_segment_degradation(self, text: str, data: Dict, position: float) -> Dict:
-        """
-        Calculate degradation metrics for a text segment
-        
-        Args:
-            text: Segment text
-            data: Full degradation data
-            position: Position in document (0.0 to 1.0)
-            
-        Returns:
-            Dict with overall score, primary issue, and breakdown
-        """
-        # This is where ACTS integration happens
-        # For demo purposes, using realistic patterns
-        
-        breakdown = {}
-        
-        # Repetition tends to cluster
-        breakdown['Repetition'] = min(100, len(set(text.split())) / max(1, len(text.split())) * 100)
-        
-        # Vagueness often front-loaded
-        breakdown['Vagueness'] = max(0, 80 - position * 60) if position < 0.5 else 20
-        
-        # Intent decay back-loaded
-        breakdown['Intent Decay'] = min(100, position * 120)
-        
-        # Confidence inflation periodic
-        breakdown['Confidence Inflation'] = 30 + 20 * abs(0.5 - (position % 0.25) * 4)
-        
-        # Voice degradation late onset
-        breakdown['Voice Degradation'] = max(0, (position - 0.7) * 200) if position > 0.7 else 5
-        
-        # Entropy collapse early
-        breakdown['Entropy Collapse'] = max(0, 60 - position * 50)
-        
-        overall = sum(breakdown.values()) / len(breakdown)
-        
-        primary = max(breakdown, key=breakdown.get)
-        
-        confidence = "High" if overall < 30 or overall > 70 else "Medium"
-        
-        return {
-            'overall': overall,
-            'primary': primary,
-            'confidence': confidence,
-            'breakdown': breakdown
-        }
-    
     def render_ascii(self, width: int = 60) -> str:
         """
         Generate ASCII beat map visualization
@@ -177,11 +319,14 @@ class LucidityBeatMap:
             return "No beat map data available. Run analyze_content() first."
         
         lines = []
-        
+
+        # Border row is identical everywhere it appears; build it once
+        border = self._box_line('═', width)
+
         # Header
-        lines.append(self._box_line('═', width))
+        lines.append(border)
         lines.append(self._box_text('LUCIDITY BEAT MAP ANALYSIS', width))
-        lines.append(self._box_line('═', width))
+        lines.append(border)
         lines.append(self._box_text('', width))
         
         # Overall timeline
@@ -194,7 +339,7 @@ class LucidityBeatMap:
         lines.append(self._box_text(f"Degradation:   {degrad_bar}", width))
         
         # Spike markers
-        spikes = self._find_spikes()
+        spikes = self.spikes
         if spikes:
             spike_line = ' ' * 15
             for spike_pos, spike_pct in spikes:
@@ -226,11 +371,11 @@ class LucidityBeatMap:
         lines.append(self._box_text('', width))
         
         # Key findings
-        findings = self._generate_findings()
+        findings = self.findings
         lines.append(self._box_text(f"🎯 Key Finding: {findings['key']}", width))
         lines.append(self._box_text(f"💡 Recommendation: {findings['rec']}", width))
-        
-        lines.append(self._box_line('═', width))
+
+        lines.append(border)
         
         return '\n'.join(lines)
     
@@ -243,45 +388,47 @@ class LucidityBeatMap:
         """
         if not self.beat_segments:
             return "<p>No beat map data available.</p>"
-        
-        html = """
+
+        # Strings are immutable, so html += in a loop copies the whole
+        # accumulated document each time; collect parts and join once
+        parts = ["""
         <div id="beatmap-container" style="font-family: 'Courier New', monospace; background: #1a1a1a; color: #00ff00; padding: 20px; border-radius: 8px;">
             <h2 style="text-align: center; color: #00ff00; margin-bottom: 20px;">LUCIDITY BEAT MAP</h2>
-            
+
             <div id="timeline" style="margin: 20px 0;">
                 <div style="display: flex; align-items: center; margin-bottom: 10px;">
                     <span style="width: 150px;">Overall Flow:</span>
                     <div style="flex: 1; height: 30px; background: #333; border-radius: 4px; overflow: hidden;">
-        """
-        
+        """]
+
         # Generate colored segments
-        for i, seg in enumerate(self.beat_segments):
-            color = self._get_segment_color_hex(seg.degradation_score)
-            width_pct = 100 / len(self.beat_segments)
-            
-            html += f'''
-                        <div style="display: inline-block; width: {width_pct}%; height: 100%; background: {color}; 
-                             cursor: pointer;" 
+        width_pct = 100 / len(self.beat_segments)
+        parts.extend(
+            f'''
+                        <div style="display: inline-block; width: {width_pct}%; height: 100%; background: {self._get_segment_color_hex(seg.degradation_score)};
+                             cursor: pointer;"
                              title="Segment {i+1}: {seg.degradation_score:.1f}% degradation - {seg.primary_issue}"
-                             onmouseover="this.style.opacity='0.7'" 
+                             onmouseover="this.style.opacity='0.7'"
                              onmouseout="this.style.opacity='1'">
                         </div>
             '''
-        
-        html += """
+            for i, seg in enumerate(self.beat_segments)
+        )
+
+        parts.append("""
                     </div>
                 </div>
             </div>
-            
+
             <div id="categories" style="margin: 20px 0;">
-        """
-        
+        """)
+
         # Category bars
         for category in self.CATEGORIES:
             avg = self._get_average_category_score(category)
             abbrev = self.CATEGORY_ABBREV[category]
-            
-            html += f'''
+
+            parts.append(f'''
                 <div style="display: flex; align-items: center; margin: 5px 0;">
                     <span style="width: 150px; font-weight: bold;">{abbrev}:</span>
                     <div style="flex: 1; height: 20px; background: #333; border-radius: 4px; overflow: hidden;">
@@ -289,26 +436,26 @@ class LucidityBeatMap:
                     </div>
                     <span style="width: 100px; text-align: right; margin-left: 10px;">{avg:.0f}% {self._get_status(avg)}</span>
                 </div>
-            '''
-        
-        html += """
+            ''')
+
+        parts.append("""
             </div>
-            
+
             <div id="insights" style="margin-top: 30px; padding: 15px; background: #2a2a2a; border-left: 4px solid #00ff00; border-radius: 4px;">
-        """
-        
-        findings = self._generate_findings()
-        html += f'''
+        """)
+
+        findings = self.findings
+        parts.append(f'''
                 <p style="margin: 5px 0;"><strong>🎯 Key Finding:</strong> {findings['key']}</p>
                 <p style="margin: 5px 0;"><strong>💡 Recommendation:</strong> {findings['rec']}</p>
-        '''
-        
-        html += """
+        ''')
+
+        parts.append("""
             </div>
         </div>
-        """
-        
-        return html
+        """)
+
+        return ''.join(parts)
     
     def generate_meeting_summary(self) -> Dict[str, str]:
         """
@@ -326,15 +473,11 @@ class LucidityBeatMap:
         
         avg_degradation = sum(s.degradation_score for s in self.beat_segments) / len(self.beat_segments)
         
-        primary_issues = {}
-        for seg in self.beat_segments:
-            primary_issues[seg.primary_issue] = primary_issues.get(seg.primary_issue, 0) + 1
+        top_issue = Counter(s.primary_issue for s in self.beat_segments).most_common(1)[0][0]
         
-        top_issue = max(primary_issues, key=primary_issues.get)
-        
-        spikes = self._find_spikes()
-        
-        findings = self._generate_findings()
+        spikes = self.spikes
+
+        findings = self.findings
         
         summary = f"Analysis of {len(self.beat_segments)} segments shows {avg_degradation:.0f}% average degradation. "
         summary += f"Primary concern: {top_issue}. "
@@ -349,110 +492,110 @@ class LucidityBeatMap:
             'action': findings['rec']
         }
     
+    @property
+    def spikes(self) -> List[Tuple[float, float]]:
+        """Degradation spikes cached from the last analysis"""
+        return self._spikes if self._spikes is not None else self._find_spikes()
+
+    @property
+    def findings(self) -> Dict[str, str]:
+        """Key findings cached from the last analysis"""
+        return self._findings if self._findings is not None else self._generate_findings()
+
     # Helper methods
-    
+
     def _box_line(self, char: str, width: int) -> str:
         """Generate box border line"""
         return f"╔{'═' * width}╗" if char == '═' else f"╠{'═' * width}╣"
     
     def _box_text(self, text: str, width: int) -> str:
         """Generate boxed text line"""
-        padding = width - len(text)
-        return f"║ {text}{' ' * padding}║"
+        return f"║ {text.ljust(width)}║"
     
     def _generate_timeline_bar(self, width: int) -> str:
         """Generate full timeline bar"""
         return f"[{'█' * width}]"
     
-    def _generate_degradation_bar(self, width: int) -> str:
-        """Generate degradation intensity bar"""
-        bar = []
-        
-        for i, seg in enumerate(self.beat_segments):
-            seg_width = width // len(self.beat_segments)
-            
-            if seg.degradation_score < 25:
-                char = '░'
-                color = 'green'
-            elif seg.degradation_score < 50:
-                char = '▒'
-                color = 'yellow'
-            elif seg.degradation_score < 75:
-                char = '▓'
-                color = 'orange'
-            else:
-                char = '█'
-                color = 'red'
-            
-            if self.use_color:
-                bar.append(f"{self.COLORS[color]}{char * seg_width}{self.COLORS['reset']}")
-            else:
-                bar.append(char * seg_width)
-        
-        return f"[{''.join(bar)}]"
+    def _generate_degradation_bar_color(self, width: int) -> str:
+        """Generate ANSI-colored degradation intensity bar"""
+        seg_width = width // len(self.beat_segments)
+
+        # Only four distinct cell strings exist; build each once and
+        # gather by bucket id instead of formatting per segment
+        cells = [
+            f"{_COLORS[color]}{char * seg_width}{_RESET}"
+            for color, char in zip(self._BUCKET_COLORS, self._BUCKET_CHARS)
+        ]
+
+        bar = ''.join(cells[bucket] for bucket in self._bucket_ids)
+        return f"[{bar}]"
+
+    def _generate_degradation_bar_plain(self, width: int) -> str:
+        """Generate plain degradation intensity bar"""
+        seg_width = width // len(self.beat_segments)
+        cells = [char * seg_width for char in self._BUCKET_CHARS]
+
+        bar = ''.join(cells[bucket] for bucket in self._bucket_ids)
+        return f"[{bar}]"
     
     def _generate_category_bar(self, category: str, width: int) -> str:
         """Generate per-category degradation bar"""
-        bar = []
-        
-        for seg in self.beat_segments:
-            score = seg.degradation_breakdown.get(category, 0)
-            seg_width = max(1, width // len(self.beat_segments))
-            
-            char = '█' if score > 50 else '░'
-            bar.append(char * seg_width)
-        
-        result = ''.join(bar)[:width]
+        cat_idx = self._cat_index[category]
+        if np is not None:
+            hot = (self._breakdown_matrix[:, cat_idx] > 50).tolist()
+        else:
+            hot = [row[cat_idx] > 50 for row in self._breakdown_matrix]
+
+        seg_width = max(1, width // len(self.beat_segments))
+
+        # Only two distinct cells exist; build both once and pick by mask
+        on = '█' * seg_width
+        off = '░' * seg_width
+        bar = ''.join(on if h else off for h in hot)
+
+        result = bar[:width]
         result += '░' * (width - len(result))
         
         return f"[{result}]"
     
     def _find_spikes(self, threshold: float = 20.0) -> List[Tuple[float, float]]:
         """Find degradation spikes above threshold"""
-        spikes = []
-        
-        for i, seg in enumerate(self.beat_segments):
-            if i == 0:
-                continue
-            
-            prev_score = self.beat_segments[i-1].degradation_score
-            diff = seg.degradation_score - prev_score
-            
-            if diff > threshold:
-                position = i / len(self.beat_segments)
-                spikes.append((position, position * 100))
-        
-        return spikes
+        if self._overall is None:
+            return []
+
+        if np is None:
+            overall = self._overall
+            n = len(overall)
+            return [
+                (i / n, i / n * 100)
+                for i in range(1, n)
+                if overall[i] - overall[i - 1] > threshold
+            ]
+
+        diffs = np.diff(self._overall)
+        idx = np.flatnonzero(diffs > threshold) + 1
+        positions = idx / len(self._overall)
+
+        return list(zip(positions.tolist(), (positions * 100).tolist()))
     
     def _get_average_category_score(self, category: str) -> float:
-        """Calculate average score for a degradation category"""
-        if not self.beat_segments:
+        """Look up the average score for a degradation category"""
+        if not self._category_avgs:
             return 0.0
-        
-        scores = [seg.degradation_breakdown.get(category, 0) for seg in self.beat_segments]
-        return sum(scores) / len(scores)
+
+        return self._category_avgs.get(category, 0.0)
     
-    def _get_status(self, score: float) -> str:
-        """Get status label for a score"""
-        if score < 25:
-            return "Good" if self.use_color else "Good"
-        elif score < 50:
-            return f"{self.COLORS['yellow']}Caution{self.COLORS['reset']}" if self.use_color else "Caution"
-        elif score < 75:
-            return f"{self.COLORS['orange']}Warning{self.COLORS['reset']}" if self.use_color else "Warning"
-        else:
-            return f"{self.COLORS['red']}Alert!{self.COLORS['reset']}" if self.use_color else "Alert!"
+    def _get_status_color(self, score: float) -> str:
+        """Get ANSI-colored status label for a score"""
+        return _STATUS_COLOR[min(int(score) // 25, 3)]
+
+    def _get_status_plain(self, score: float) -> str:
+        """Get plain status label for a score"""
+        return _STATUS_PLAIN[min(int(score) // 25, 3)]
     
     def _get_segment_color_hex(self, score: float) -> str:
         """Get hex color for segment based on score"""
-        if score < 25:
-            return '#00ff00'  # Green
-        elif score < 50:
-            return '#ffff00'  # Yellow
-        elif score < 75:
-            return '#ff8800'  # Orange
-        else:
-            return '#ff0000'  # Red
+        return _COLORS_HEX[min(int(score) // 25, 3)]
     
     def _generate_findings(self) -> Dict[str, str]:
         """Generate key findings and recommendations"""
@@ -465,8 +608,10 @@ class LucidityBeatMap:
         worst_score = category_avgs[worst_category]
         
         # Find where degradation peaks
-        peak_seg = max(self.beat_segments, key=lambda s: s.degradation_score)
-        peak_pos = self.beat_segments.index(peak_seg)
+        if np is not None:
+            peak_pos = int(self._overall.argmax())
+        else:
+            peak_pos = max(range(len(self._overall)), key=self._overall.__getitem__)
         peak_pct = int((peak_pos / len(self.beat_segments)) * 100)
         
         # Generate finding
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Build script for the optional _lucidity_core extension
+
+The compiled kernel accelerates per-segment scoring for very large
+segment counts; lucidity_beatmap works without it.
+"""
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension('_lucidity_core', ['_lucidity_core.pyx'])],
+        compiler_directives={'language_level': '3'}
+    )
+except ImportError:
+    ext_modules = []
+
+setup(
+    name='lucidity-beatmap',
+    version='1.0.0',
+    py_modules=['lucidity_beatmap'],
+    python_requires='>=3.10',
+    ext_modules=ext_modules
+)